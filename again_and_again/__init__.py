@@ -1,24 +1,28 @@
 """again-and-again: Personal utility library for things I do again and again."""
 
-from importlib.metadata import version
-
-from again_and_again.src.git_wizard import get_commit_hash, get_git_repo_root_path
-from again_and_again.src.gpu_wizard import get_device
-from again_and_again.src.hydra_wizard import get_the_hydra_config_path, load_hydra_config
-from again_and_again.src.log_wizard import logging_setup, reset_logging
-from again_and_again.src.mlflow_wizard import (
-    can_connect_to_databricks,
-    experiment_exists,
-    load_mlflow_env,
-)
-from again_and_again.src.path_wizard import (
-    create_unique_path_inside_of_a_git_repo,
-    normalize_directory_path,
-    normalize_file_path,
-    path_to_string,
-)
-
-__version__ = version("again-and-again")
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from again_and_again.src.git_wizard import (
+        get_commit_hash,
+        get_git_repo_root_path,
+        get_repo_root_and_commit_hash,
+    )
+    from again_and_again.src.gpu_wizard import get_device
+    from again_and_again.src.hydra_wizard import get_the_hydra_config_path, load_hydra_config
+    from again_and_again.src.log_wizard import logging_setup, reset_logging
+    from again_and_again.src.mlflow_wizard import (
+        can_connect_to_databricks,
+        experiment_exists,
+        load_mlflow_env,
+    )
+    from again_and_again.src.path_wizard import (
+        create_unique_path_inside_of_a_git_repo,
+        normalize_directory_path,
+        normalize_file_path,
+        path_to_string,
+    )
 
 __all__ = [
     "__version__",
@@ -26,6 +30,7 @@ __all__ = [
     "normalize_directory_path",
     "get_git_repo_root_path",
     "get_commit_hash",
+    "get_repo_root_and_commit_hash",
     "get_device",
     "path_to_string",
     "create_unique_path_inside_of_a_git_repo",
@@ -37,3 +42,44 @@ __all__ = [
     "experiment_exists",
     "load_mlflow_env",
 ]
+
+# Owning submodule for each public name. Binding names through module-level
+# __getattr__ (PEP 562) means importing the package executes none of the
+# submodules; each one is imported on first attribute access and cached.
+_SUBMODULE_BY_NAME = {
+    "get_git_repo_root_path": "again_and_again.src.git_wizard",
+    "get_commit_hash": "again_and_again.src.git_wizard",
+    "get_repo_root_and_commit_hash": "again_and_again.src.git_wizard",
+    "get_device": "again_and_again.src.gpu_wizard",
+    "get_the_hydra_config_path": "again_and_again.src.hydra_wizard",
+    "load_hydra_config": "again_and_again.src.hydra_wizard",
+    "logging_setup": "again_and_again.src.log_wizard",
+    "reset_logging": "again_and_again.src.log_wizard",
+    "can_connect_to_databricks": "again_and_again.src.mlflow_wizard",
+    "experiment_exists": "again_and_again.src.mlflow_wizard",
+    "load_mlflow_env": "again_and_again.src.mlflow_wizard",
+    "normalize_file_path": "again_and_again.src.path_wizard",
+    "normalize_directory_path": "again_and_again.src.path_wizard",
+    "path_to_string": "again_and_again.src.path_wizard",
+    "create_unique_path_inside_of_a_git_repo": "again_and_again.src.path_wizard",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first access (PEP 562)."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("again-and-again")
+    elif name in _SUBMODULE_BY_NAME:
+        value = getattr(import_module(_SUBMODULE_BY_NAME[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the module so subsequent accesses skip this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public API for discoverability."""
+    return sorted(__all__)
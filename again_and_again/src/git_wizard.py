@@ -1,48 +1,277 @@
 """Git utilities for repository information and operations."""
 
+import atexit
+import contextlib
+import functools
+import os
 import pathlib
 import subprocess
+import threading
+from typing import IO
 
+try:
+    import pygit2
 
-def get_git_repo_root_path() -> pathlib.Path:
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+# Directories already known to have no git repository above them. Lets
+# repeated calls from a non-git subtree fail immediately instead of
+# re-statting every ancestor up to the filesystem root.
+_NEGATIVE_ROOTS: set[str] = set()
+
+
+@functools.cache
+def _find_git_root(cwd: pathlib.Path) -> pathlib.Path:
+    """Walk upward from cwd looking for a directory containing .git.
+
+    The walk deliberately uses os.path string operations instead of pathlib:
+    each pathlib step allocates a new Path and dispatches through its flavour
+    machinery, while os.path calls go straight to C. Only the final result is
+    wrapped in a Path.
+    """
+    if PYGIT2_AVAILABLE:
+        # libgit2 does the same ascent as a single in-process C call.
+        discovered = pygit2.discover_repository(os.fspath(cwd))
+        if discovered is None:
+            raise FileNotFoundError(f"Could not identify a git repository starting from {cwd}")
+        # discover_repository returns the git dir, which for worktrees is
+        # <main>/.git/worktrees/<name>; Repository.workdir maps any layout
+        # back to the checkout root. It is None for bare repositories, where
+        # the walk below reproduces the non-pygit2 behavior.
+        workdir = pygit2.Repository(discovered).workdir
+        if workdir is not None:
+            return pathlib.Path(workdir)
+
+    directory = os.fspath(cwd)
+    visited: list[str] = []
+    while True:
+        if directory in _NEGATIVE_ROOTS:
+            _NEGATIVE_ROOTS.update(visited)
+            raise FileNotFoundError(f"Could not identify a git repository starting from {cwd}")
+        git_probe = os.path.join(directory, ".git")
+        # Fast path: .git is a directory. The isfile check keeps git
+        # worktrees working, where .git is a file containing "gitdir: <path>".
+        if os.path.isdir(git_probe) or os.path.isfile(git_probe):
+            return pathlib.Path(directory)
+        visited.append(directory)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            _NEGATIVE_ROOTS.update(visited)
+            raise FileNotFoundError(f"Could not identify a git repository starting from {cwd}")
+        directory = parent
+
+
+def get_git_repo_root_path(cwd: pathlib.Path | None = None) -> pathlib.Path:
     """Get the root path of the current git repository.
 
-    Searches upward from the current working directory to find a directory
-    containing a .git folder.
+    Searches upward from cwd (the current working directory by default) to
+    find a directory containing a .git folder. Results are memoized per
+    starting directory, so repeated calls from the same location cost a
+    single dict lookup instead of a stat per ancestor. Tests that change
+    the working directory mid-process can reset the cache with
+    ``get_git_repo_root_path.cache_clear()``.
+
+    Args:
+        cwd: Directory to start the search from. Defaults to the current
+            working directory.
 
     Returns:
         The absolute path to the git repository root.
 
     Raises:
-        FileNotFoundError: If no git repository is found in the current
+        FileNotFoundError: If no git repository is found in the starting
             directory or any of its parents.
     """
-    current_path = pathlib.Path.cwd()
-    for parent in [current_path, *current_path.parents]:
-        if (parent / ".git").exists():
-            return parent
-    raise FileNotFoundError(f"Could not identify a git repository starting from {current_path}")
+    return _find_git_root(pathlib.Path(os.getcwd()) if cwd is None else cwd)
 
 
-def get_commit_hash() -> str:
-    """Get the current HEAD commit hash.
+def _clear_root_caches() -> None:
+    """Reset both the memoized roots and the negative-result cache."""
+    _find_git_root.cache_clear()
+    _NEGATIVE_ROOTS.clear()
 
-    Returns:
-        The 40-character SHA-1 hash of the current HEAD commit.
+
+get_git_repo_root_path.cache_clear = _clear_root_caches  # type: ignore[attr-defined]
+
+
+def _rev_parse(*args: str) -> list[str]:
+    """Run ``git rev-parse`` with the given arguments and return its output lines.
 
     Raises:
-        subprocess.CalledProcessError: If the git command fails (e.g., not in
-            a git repository or git is not installed).
         RuntimeError: If not in a git repository or git is not installed.
     """
     try:
-        return (
-            subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                stderr=subprocess.DEVNULL,
-            )
-            .decode("utf-8")
-            .strip()
+        output = subprocess.check_output(
+            ["git", "rev-parse", *args],
+            stderr=subprocess.DEVNULL,
         )
     except (subprocess.CalledProcessError, FileNotFoundError) as e:
         raise RuntimeError("Not in a git repository or git is not installed") from e
+    return output.decode("utf-8").splitlines()
+
+
+def get_repo_root_and_commit_hash() -> tuple[pathlib.Path, str]:
+    """Get the repository root and HEAD commit hash from one git invocation.
+
+    Callers that need both values would otherwise pay for two separate
+    lookups; ``git rev-parse --show-toplevel HEAD`` returns both from a
+    single fork+exec.
+
+    Returns:
+        A tuple of (repository root path, 40-character commit hash).
+
+    Raises:
+        RuntimeError: If not in a git repository or git is not installed.
+    """
+    toplevel, commit_hash = _rev_parse("--show-toplevel", "HEAD")
+    return pathlib.Path(toplevel.strip()), commit_hash.strip()
+
+
+class _GitCoproc:
+    """A long-running ``git cat-file --batch-check`` coprocess.
+
+    Callers that resolve revisions in a loop (per MLflow run, per Hydra sweep
+    trial) would otherwise fork a fresh git process per call; this keeps one
+    pipe open and answers each request with a single write/read round trip.
+    """
+
+    def __init__(self, git_dir: pathlib.Path) -> None:
+        self._process = subprocess.Popen(
+            ["git", "--git-dir", os.fspath(git_dir), "cat-file", "--batch-check"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        if self._process.stdin is None or self._process.stdout is None:  # pragma: no cover
+            raise RuntimeError("Could not open pipes to the git coprocess")
+        # typeshed types Popen pipes as IO[Any]; pin them to IO[str] (the
+        # process is opened with text=True) so readline() results stay str.
+        self._stdin: IO[str] = self._process.stdin
+        self._stdout: IO[str] = self._process.stdout
+        atexit.register(self.close)
+
+    def resolve(self, rev: str) -> str:
+        """Resolve a revision (e.g. "HEAD") to an object hash.
+
+        Raises:
+            RuntimeError: If the revision cannot be resolved.
+        """
+        self._stdin.write(f"{rev}\n")
+        self._stdin.flush()
+        # Reply format: "<sha> <type> <size>" or "<rev> missing".
+        reply = self._stdout.readline().strip()
+        sha, _, rest = reply.partition(" ")
+        if not rest or rest == "missing":
+            raise RuntimeError(f"Could not resolve {rev!r} via the git coprocess")
+        return sha
+
+    def alive(self) -> bool:
+        """Whether the coprocess is still running."""
+        return self._process.poll() is None
+
+    def close(self) -> None:
+        """Close the pipes and terminate the coprocess."""
+        if self.alive():
+            with contextlib.suppress(OSError, subprocess.TimeoutExpired):
+                self._stdin.close()
+                self._process.terminate()
+                self._process.wait(timeout=5)
+
+
+# One coprocess per thread so concurrent callers never interleave requests
+# on the same stdin.
+_COPROC_LOCAL = threading.local()
+
+
+def _get_coproc() -> _GitCoproc:
+    """Get (lazily starting) this thread's git coprocess."""
+    coproc: _GitCoproc | None = getattr(_COPROC_LOCAL, "coproc", None)
+    if coproc is None or not coproc.alive():
+        coproc = _GitCoproc(get_git_repo_root_path() / ".git")
+        _COPROC_LOCAL.coproc = coproc
+    return coproc
+
+
+def _read_head_direct(git_dir: pathlib.Path) -> str | None:
+    """Resolve HEAD by reading repository files directly, without forking git.
+
+    Covers the layouts ``git rev-parse HEAD`` handles in practice: symbolic
+    refs, detached HEADs, packed refs, and worktree ``.git`` pointer files.
+    Returns None when the layout is not understood, so the caller can fall
+    back to git itself.
+    """
+    if git_dir.is_file():
+        # Worktree layout: .git is a file containing "gitdir: <path>".
+        pointer = git_dir.read_text(encoding="utf-8").strip()
+        if not pointer.startswith("gitdir: "):
+            return None
+        target = pointer.removeprefix("gitdir: ")
+        git_dir = pathlib.Path(
+            os.path.normpath(os.path.join(os.path.dirname(os.fspath(git_dir)), target))
+        )
+
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref: "):
+        # Detached HEAD: the file holds the hash itself.
+        return head
+
+    ref = head.removeprefix("ref: ")
+    ref_path = git_dir / ref
+    if ref_path.is_file():
+        return ref_path.read_text(encoding="utf-8").strip()
+
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(" ", 1)[0]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_commit_hash(fast: bool = True, use_coproc: bool = False) -> str:
+    """Get the current HEAD commit hash.
+
+    The result is memoized: HEAD cannot move within a normal run, so repeat
+    callers get the cached hash without touching the repository. Call
+    ``get_commit_hash.cache_clear()`` if HEAD may have changed mid-process.
+
+    Semantics match ``git rev-parse HEAD``. By default the hash is resolved
+    by reading ``.git/HEAD`` (and the ref file or packed-refs it points to)
+    directly from disk, avoiding the ~10-50 ms startup cost of a ``git``
+    subprocess; git itself is only invoked for layouts the direct read does
+    not understand.
+
+    Args:
+        fast: Use the direct on-disk read (or pygit2 when installed). Pass
+            False to always shell out to ``git rev-parse HEAD``, preserving
+            the pre-optimization behavior byte for byte.
+        use_coproc: Route the lookup through a long-running per-thread
+            ``git cat-file --batch-check`` coprocess. Worth it when calling
+            in a tight loop; off by default.
+
+    Returns:
+        The 40-character SHA-1 hash of the current HEAD commit.
+
+    Raises:
+        RuntimeError: If not in a git repository or git is not installed.
+    """
+    if use_coproc:
+        return _get_coproc().resolve("HEAD")
+
+    if fast:
+        if PYGIT2_AVAILABLE:
+            # In-process libgit2 lookup: a C call instead of file parsing or a fork.
+            with contextlib.suppress(OSError, KeyError, pygit2.GitError):
+                repo = pygit2.Repository(os.fspath(get_git_repo_root_path()))
+                return str(repo.head.target)
+
+        with contextlib.suppress(OSError):
+            commit_hash = _read_head_direct(get_git_repo_root_path() / ".git")
+            if commit_hash is not None:
+                return commit_hash
+
+    return _rev_parse("HEAD")[0].strip()
@@ -2,17 +2,80 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import functools
+import importlib.util
+import platform
+import sys
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import torch
 
-try:
+__all__ = ["TORCH_AVAILABLE", "get_device"]
+
+# find_spec only probes sys.path for the distribution; the expensive torch
+# import (CUDA/MKL/BLAS state, easily hundreds of ms) is deferred until
+# get_device() is actually called.
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+
+
+@functools.cache
+def _import_torch() -> Any:
+    """Import torch on first use and cache the module."""
     import torch
 
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+    return torch
+
+
+_VALID_DEVICES = frozenset({"cpu", "cuda", "mps"})
+
+
+def _mps_available(torch: Any) -> bool:
+    """Whether the MPS backend can be used.
+
+    is_built() is a compile-time constant, unlike is_available() which does
+    a Metal framework roundtrip per call; the mac_ver() gate (cached by the
+    stdlib) rules out non-macOS hosts. getattr keeps PyTorch < 2.4 working.
+    """
+    return getattr(torch.backends.mps, "is_built", lambda: False)() and bool(platform.mac_ver()[0])
+
+
+def _cuda_available(torch: Any) -> bool:
+    """Whether the CUDA backend can be used."""
+    return bool(torch.cuda.is_available())
+
+
+# Backends worth probing per platform: the MPS probe is pure waste off macOS,
+# and the CUDA driver probe is pure waste on Apple Silicon.
+_PROBE_ORDER: dict[str, tuple[tuple[str, Callable[[Any], bool]], ...]] = {
+    "darwin": (("mps", _mps_available),),
+    "linux": (("cuda", _cuda_available),),
+    "win32": (("cuda", _cuda_available),),
+}
+
+# Resolved once on the first no-override call; the hot path is then a single
+# attribute read instead of an lru_cache dict lookup.
+_DEFAULT_DEVICE: torch.device | None = None
+
+
+@functools.cache
+def _resolve_device(override: Literal["cpu", "cuda", "mps"] | None) -> torch.device:
+    """Resolve and memoize the device for a given override.
+
+    The MPS and CUDA probes are not free (Metal framework roundtrip, CUDA
+    driver initialization) and their answers are constant within a process,
+    so each override value is only ever probed once.
+    """
+    torch = _import_torch()
+    if override is not None:
+        return torch.device(override)
+
+    for name, probe in _PROBE_ORDER.get(sys.platform, ()):
+        if probe(torch):
+            return torch.device(name)
+    return torch.device("cpu")
 
 
 def get_device(override: Literal["cpu", "cuda", "mps"] | None = None) -> torch.device:
@@ -23,6 +86,10 @@ def get_device(override: Literal["cpu", "cuda", "mps"] | None = None) -> torch.d
     - NVIDIA GPU: Returns CUDA
     - Otherwise: Returns CPU
 
+    The result is cached per override, so repeated calls skip the MPS/CUDA
+    availability probes. Tests that monkey-patch the probes (e.g.
+    `torch.cuda.is_available`) should call `get_device.cache_clear()` first.
+
     Args:
         override: Force a specific device instead of auto-detection.
             Valid values are "cpu", "cuda", or "mps".
@@ -44,14 +111,23 @@ def get_device(override: Literal["cpu", "cuda", "mps"] | None = None) -> torch.d
             "torch is not available. Install with `uv add again-and-again[torch]`"
             " or `pip install again-and-again[torch]`"
         )
-    if override is not None and override not in ["cpu", "cuda", "mps"]:
+    if override is None:
+        global _DEFAULT_DEVICE  # noqa: PLW0603
+        if _DEFAULT_DEVICE is None:
+            _DEFAULT_DEVICE = _resolve_device(None)
+        return _DEFAULT_DEVICE
+
+    if override not in _VALID_DEVICES:
         raise ValueError(f"Invalid device: {override}")
 
-    if override is not None:
-        return torch.device(override)
+    return _resolve_device(override)
 
-    if torch.backends.mps.is_available():
-        return torch.device("mps")
-    if torch.cuda.is_available():
-        return torch.device("cuda")
-    return torch.device("cpu")
+
+def _clear_device_caches() -> None:
+    """Reset the default-device constant and the per-override cache."""
+    global _DEFAULT_DEVICE  # noqa: PLW0603
+    _DEFAULT_DEVICE = None
+    _resolve_device.cache_clear()
+
+
+get_device.cache_clear = _clear_device_caches  # type: ignore[attr-defined]
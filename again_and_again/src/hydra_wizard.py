@@ -3,22 +3,31 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib.util
 import pathlib
 from typing import TYPE_CHECKING, Any
 
 from again_and_again.src.git_wizard import get_git_repo_root_path
 
 if TYPE_CHECKING:
-    import hydra
     from omegaconf import DictConfig
 
-try:
+# find_spec only probes sys.path; the real hydra/omegaconf imports are
+# deferred until load_hydra_config() is actually called.
+HYDRA_AVAILABLE = (
+    importlib.util.find_spec("hydra") is not None
+    and importlib.util.find_spec("omegaconf") is not None
+)
+
+
+@functools.cache
+def _import_hydra() -> tuple[Any, Any]:
+    """Import hydra and OmegaConf on first use and cache them."""
     import hydra
-    from omegaconf import DictConfig, OmegaConf
+    from omegaconf import OmegaConf
 
-    HYDRA_AVAILABLE = True
-except ImportError:
-    HYDRA_AVAILABLE = False
+    return hydra, OmegaConf
 
 
 def _parse_hydra_argv(argv: list[str]) -> tuple[str | None, list[str], str | None]:
@@ -90,6 +99,7 @@ def load_hydra_config(
             "hydra-core is not available. Install with "
             "`uv add again-and-again[hydra]` or `pip install again-and-again[hydra]`"
         )
+    hydra, omega_conf = _import_hydra()
 
     cli_config_name: str | None = None
     cli_overrides: list[str] = []
@@ -112,7 +122,7 @@ def load_hydra_config(
         dict_cfg: DictConfig = hydra.compose(
             config_name=resolved_config_name, overrides=resolved_overrides or None
         )
-        raw_hydra_config_dictionary = OmegaConf.to_container(dict_cfg, resolve=True)
+        raw_hydra_config_dictionary = omega_conf.to_container(dict_cfg, resolve=True)
         if not isinstance(raw_hydra_config_dictionary, dict):
             msg = "Expected a dictionary from OmegaConf.to_container"
             raise TypeError(msg)
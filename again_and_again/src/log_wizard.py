@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import sys
 from typing import TYPE_CHECKING
@@ -11,13 +12,24 @@ from again_and_again.src.path_wizard import normalize_file_path
 if TYPE_CHECKING:
     import pathlib
 
-try:
-    from loguru import logger
+    from loguru import Logger
 
-    LOGURU_AVAILABLE = True
-except ImportError:
-    LOGURU_AVAILABLE = False
-    logger = None  # type: ignore[assignment]
+# find_spec only probes sys.path; the real loguru import is deferred until
+# logging_setup()/reset_logging() is actually called.
+LOGURU_AVAILABLE = importlib.util.find_spec("loguru") is not None
+
+# Bound to loguru's logger on first logging_setup()/reset_logging() call.
+logger: Logger | None = None
+
+
+def _import_logger() -> Logger:
+    """Import loguru's logger on first use and bind the module global."""
+    global logger  # noqa: PLW0603
+    if logger is None:
+        from loguru import logger as loguru_logger
+
+        logger = loguru_logger
+    return logger
 
 
 # Track whether logging has been configured
@@ -34,6 +46,10 @@ class InterceptHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord) -> None:  # noqa: PLR6301
         """Emit a log record by passing it to loguru."""
+        # Only reachable once logging_setup has run, so this is a no-op
+        # lookup; binding locally narrows the Logger | None global.
+        logger = _import_logger()
+
         # Get corresponding Loguru level if it exists
         level: str | int
         try:
@@ -105,6 +121,7 @@ def logging_setup(
             "loguru is not available. Install with `uv add again-and-again[logging]`"
             " or `pip install again-and-again[logging]`"
         )
+    logger = _import_logger()
 
     global _LOGGING_CONFIGURED  # noqa: PLW0603
 
@@ -217,6 +234,7 @@ def reset_logging() -> None:
             "loguru is not available. Install with `uv add again-and-again[logging]`"
             " or `pip install again-and-again[logging]`"
         )
+    logger = _import_logger()
 
     global _LOGGING_CONFIGURED  # noqa: PLW0603
     _LOGGING_CONFIGURED = False
@@ -2,31 +2,59 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import pathlib
 
-try:
-    from mlflow import set_tracking_uri
-    from mlflow.exceptions import MlflowException
-    from mlflow.tracking import MlflowClient
+# find_spec only probes sys.path; the real mlflow/dotenv imports are deferred
+# until a function that needs them is actually called.
+MLFLOW_AVAILABLE = importlib.util.find_spec("mlflow") is not None
+DOTENV_AVAILABLE = importlib.util.find_spec("dotenv") is not None
 
-    MLFLOW_AVAILABLE = True
-except ImportError:
-    set_tracking_uri = None  # type: ignore[assignment]
-    MlflowClient = None  # type: ignore[assignment]
-    MlflowException = None  # type: ignore[assignment]
-    MLFLOW_AVAILABLE = False
+# Populated lazily on first use; tests may patch these names directly.
+set_tracking_uri: Any = None
+MlflowClient: Any = None
+MlflowException: Any = None
+dotenv_values: Any = None
 
-try:
-    from dotenv import dotenv_values
 
-    DOTENV_AVAILABLE = True
-except ImportError:
-    dotenv_values = None  # type: ignore[assignment]
-    DOTENV_AVAILABLE = False
+def _load_mlflow_symbols() -> None:
+    """Import the mlflow symbols on first use.
+
+    Names that are already bound at module level (e.g. patched in tests)
+    are left alone.
+    """
+    global set_tracking_uri, MlflowClient, MlflowException  # noqa: PLW0603
+    if set_tracking_uri is not None and MlflowClient is not None and MlflowException is not None:
+        return
+    try:
+        from mlflow import set_tracking_uri as _set_tracking_uri
+        from mlflow.exceptions import MlflowException as _MlflowException
+        from mlflow.tracking import MlflowClient as _MlflowClient
+    except ImportError:
+        # MLFLOW_AVAILABLE (and the symbols in use) may be patched in tests
+        # without mlflow installed; leave the unpatched names as None.
+        return
+
+    if set_tracking_uri is None:
+        set_tracking_uri = _set_tracking_uri
+    if MlflowClient is None:
+        MlflowClient = _MlflowClient
+    if MlflowException is None:
+        MlflowException = _MlflowException
+
+
+def _load_dotenv_symbols() -> None:
+    """Import dotenv_values on first use, unless already bound (e.g. patched)."""
+    global dotenv_values  # noqa: PLW0603
+    if dotenv_values is None:
+        from dotenv import dotenv_values as _dotenv_values
+
+        dotenv_values = _dotenv_values
+
 
 _MLFLOW_ENV_VARS = [
     "DATABRICKS_HOST",
@@ -77,6 +105,7 @@ def load_mlflow_env(dotenv_path: str | pathlib.Path | None = None) -> dict[str,
             "python-dotenv is not available. Install with `uv add again-and-again[mlflow]`"
             " or `pip install again-and-again[mlflow]`"
         )
+    _load_dotenv_symbols()
     file_values = dotenv_values(dotenv_path)
     for var in _MLFLOW_ENV_VARS:
         if var in file_values and file_values[var] is not None:
@@ -132,6 +161,7 @@ def experiment_exists(
     experiment_name, experiment_id = _experiment_exists_input_checking(
         experiment_name, experiment_id
     )
+    _load_mlflow_symbols()
     client = MlflowClient()
 
     if experiment_name is not None:
@@ -174,6 +204,7 @@ def can_connect_to_databricks(tracking_uri: str | None = None) -> bool:
         True
     """
     _ensure_mlflow_is_available()
+    _load_mlflow_symbols()
     if tracking_uri is not None:
         set_tracking_uri(tracking_uri)
 
@@ -2,19 +2,132 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import pathlib
-from datetime import datetime
 
-from again_and_again.src.git_wizard import get_commit_hash, get_git_repo_root_path
+__all__ = [
+    "create_unique_path_inside_of_a_git_repo",
+    "normalize_directory_path",
+    "normalize_file_path",
+    "path_to_string",
+]
+
+# Directories this process has already created or observed to exist. Checking
+# membership here turns the repeat-call mkdir (which would just return EEXIST)
+# into a set lookup with no syscall at all.
+_ENSURED_DIRS: set[str] = set()
+
+
+def _mark_ensured(directory: str) -> None:
+    """Record a directory and all its ancestors as existing."""
+    while directory not in _ENSURED_DIRS:
+        _ENSURED_DIRS.add(directory)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+
+def _ensure_dir(directory: str) -> None:
+    """Create a directory, tolerating one that already exists.
+
+    EAFP beats makedirs(exist_ok=True) here: a bare mkdir is one syscall,
+    while makedirs stats the path (and, on EEXIST, re-stats to confirm it is
+    a directory) before giving up. Only when the parent is missing do we fall
+    back to the full recursive creation.
+    """
+    try:
+        os.mkdir(directory)
+    except FileExistsError:
+        # Matches makedirs(exist_ok=True): an existing non-directory (a
+        # regular file, say) is still an error.
+        if not os.path.isdir(directory):
+            raise
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_git_root() -> pathlib.Path:
+    """get_git_repo_root_path() memoized for the life of the process.
+
+    The fake_git_repo fixture in tests/conftest.py clears this cache around
+    each test so monkeypatched git functions take effect. git_wizard is
+    imported here, not at module top, so callers that only normalize paths
+    never pay for it (it pulls in subprocess and friends).
+    """
+    from again_and_again.src import git_wizard
+
+    return git_wizard.get_git_repo_root_path()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_commit_hash() -> str:
+    """get_commit_hash() memoized for the life of the process.
+
+    The commit hash cannot change within a run, so the git lookup happens at
+    most once per process. Cleared alongside _cached_git_root in tests.
+    """
+    from again_and_again.src import git_wizard
+
+    return git_wizard.get_commit_hash()
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_file_cached(
+    abs_path: str, path_should_exist: bool, make_parent_path: bool
+) -> pathlib.Path:
+    """Syscall-heavy half of normalize_file_path, memoized per absolute path.
+
+    These helpers get called repeatedly on the same paths (every log file,
+    every config load); after the first call the existence check and mkdir
+    collapse to a cache hit. mkdir(exist_ok=True) is idempotent and existence
+    can go stale, so this is a session cache — reset it with
+    ``normalize_file_path.cache_clear()`` if the filesystem changed under it.
+    """
+    # realpath(strict=True) validates existence and canonicalizes symlinks in
+    # a single pass, instead of a resolve() walk followed by a separate stat.
+    if path_should_exist:
+        try:
+            abs_path = os.path.realpath(abs_path, strict=True)
+        except OSError as e:
+            raise FileNotFoundError(f"Path {abs_path} does not exist") from e
+
+    if make_parent_path:
+        parent = os.path.dirname(abs_path)
+        if parent not in _ENSURED_DIRS:
+            # One stat beats makedirs in the common already-exists case:
+            # makedirs walks every ancestor before its mkdir returns EEXIST.
+            if not os.path.isdir(parent):
+                os.makedirs(parent, exist_ok=True)
+            _mark_ensured(parent)
+
+    return pathlib.Path(abs_path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_directory_cached(abs_path: str, make_path: bool) -> pathlib.Path:
+    """Syscall-heavy half of normalize_directory_path, memoized per absolute path.
+
+    Same session-cache semantics as _normalize_file_cached; reset with
+    ``normalize_directory_path.cache_clear()``.
+    """
+    if make_path and abs_path not in _ENSURED_DIRS:
+        _ensure_dir(abs_path)
+        _mark_ensured(abs_path)
+
+    return pathlib.Path(abs_path)
 
 
 def normalize_file_path(
     path: str | pathlib.Path, path_should_exist: bool = False, make_parent_path: bool = True
 ) -> pathlib.Path:
-    """Normalize a file path to a resolved pathlib.Path object.
+    """Normalize a file path to an absolute pathlib.Path object.
 
-    Converts strings or Path objects to absolute, resolved paths with optional
-    parent directory creation.
+    Converts strings or Path objects to lexically absolute paths with
+    optional parent directory creation. Symlinks are only resolved when
+    path_should_exist is True.
 
     Args:
         path: The file path as a string or pathlib.Path.
@@ -24,7 +137,8 @@ def normalize_file_path(
             exist. Defaults to True.
 
     Returns:
-        A resolved absolute pathlib.Path object.
+        An absolute pathlib.Path object (symlink-resolved when
+        path_should_exist is True, lexical otherwise).
 
     Raises:
         TypeError: If path is not a string or pathlib.Path.
@@ -34,25 +148,22 @@ def normalize_file_path(
         >>> path = normalize_file_path("data/output.txt")
         >>> path = normalize_file_path("/absolute/path.txt", path_should_exist=True)
     """
-    if not isinstance(path, str | pathlib.Path):
+    if not isinstance(path, (str, pathlib.PurePath)):
         raise TypeError(f"Expected str or pathlib.Path, got {type(path)}")
 
-    normalized_path = pathlib.Path(path).resolve()
-
-    if path_should_exist and not normalized_path.exists():
-        raise FileNotFoundError(f"Path {normalized_path} does not exist")
-
-    if make_parent_path:
-        normalized_path.parent.mkdir(parents=True, exist_ok=True)
-
-    return normalized_path
+    # os.path.abspath is lexical: unlike resolve() it skips the per-component
+    # lstat symlink walk, which dominates this syscall-bound function. It is
+    # applied before the cache so relative inputs stay correct across chdir.
+    return _normalize_file_cached(
+        os.path.abspath(os.fspath(path)), path_should_exist, make_parent_path
+    )
 
 
 def normalize_directory_path(path: str | pathlib.Path, make_path: bool = True) -> pathlib.Path:
-    """Normalize a directory path to a resolved pathlib.Path object.
+    """Normalize a directory path to an absolute pathlib.Path object.
 
-    Converts strings or Path objects to absolute, resolved paths with optional
-    directory creation.
+    Converts strings or Path objects to lexically absolute paths (symlinks
+    are not resolved) with optional directory creation.
 
     Args:
         path: The directory path as a string or pathlib.Path.
@@ -60,7 +171,7 @@ def normalize_directory_path(path: str | pathlib.Path, make_path: bool = True) -
             exist. Defaults to True.
 
     Returns:
-        A resolved absolute pathlib.Path object.
+        A lexically absolute pathlib.Path object.
 
     Raises:
         TypeError: If path is not a string or pathlib.Path.
@@ -69,29 +180,56 @@ def normalize_directory_path(path: str | pathlib.Path, make_path: bool = True) -
         >>> dir_path = normalize_directory_path("data/processed")
         >>> dir_path = normalize_directory_path("existing/dir", make_path=False)
     """
-    if not isinstance(path, str | pathlib.Path):
+    if not isinstance(path, (str, pathlib.PurePath)):
         raise TypeError(f"Expected str or pathlib.Path, got {type(path)}")
 
-    normalized_path = pathlib.Path(path).resolve()
+    return _normalize_directory_cached(os.path.abspath(os.fspath(path)), make_path)
+
+
+def _clear_normalize_caches() -> None:
+    """Reset the memoized normalizations and the ensured-directory set.
+
+    The ensured-dir set backs both normalize functions, so clearing either
+    one's cache drops all three layers — otherwise a directory deleted after
+    being ensured would never be recreated.
+    """
+    _normalize_file_cached.cache_clear()
+    _normalize_directory_cached.cache_clear()
+    _ENSURED_DIRS.clear()
+
+
+normalize_file_path.cache_clear = _clear_normalize_caches  # type: ignore[attr-defined]
+normalize_directory_path.cache_clear = _clear_normalize_caches  # type: ignore[attr-defined]
 
-    if make_path:
-        normalized_path.mkdir(parents=True, exist_ok=True)
 
-    return normalized_path
+@functools.lru_cache(maxsize=4096)
+def _path_to_string_cached(source: pathlib.PurePath) -> str:
+    """String conversion of a Path, memoized per path value.
+
+    Logging wrappers tend to stringify the same handful of Path objects over
+    and over; after the first call this is a dict hit. Relative paths are
+    resolved against the cwd at first call — same session-cache caveat as the
+    normalize helpers, reset with ``path_to_string.cache_clear()``.
+    """
+    # Absolute paths need no cwd lookup or normalization pass; str() on a
+    # constructed Path is just a join of its cached parts.
+    if source.is_absolute():
+        return str(source)
+    return os.path.abspath(os.fspath(source))
 
 
 def path_to_string(source: str | pathlib.Path) -> str:
     """Convert a path to its string representation.
 
-    Converts pathlib.Path objects to resolved absolute path strings.
-    String paths are returned unchanged.
+    Converts pathlib.Path objects to lexically absolute path strings
+    (symlinks are not resolved). String paths are returned unchanged.
 
     Args:
         source: The path as a string or pathlib.Path object.
 
     Returns:
         The path as a string. If source was a Path object, returns the
-        resolved absolute path string.
+        lexically absolute path string.
 
     Example:
         >>> path_to_string(Path("./data"))
@@ -99,11 +237,18 @@ def path_to_string(source: str | pathlib.Path) -> str:
         >>> path_to_string("/some/path")
         '/some/path'
     """
-    if isinstance(source, pathlib.Path):
-        return str(source.resolve())
+    # Strings are the most common input and already the target type; test
+    # them first so the hot branch is one isinstance and a return.
+    if isinstance(source, str):
+        return source
+    if isinstance(source, pathlib.PurePath):
+        return _path_to_string_cached(source)
     return source
 
 
+path_to_string.cache_clear = _path_to_string_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def create_unique_path_inside_of_a_git_repo(
     output_namespace: str | pathlib.Path | None = None,
 ) -> pathlib.Path:
@@ -140,26 +285,49 @@ def create_unique_path_inside_of_a_git_repo(
     if output_namespace is None:
         output_namespace = "outputs"
 
-    # Get the git repo root for validation
-    git_root = get_git_repo_root_path()
-
-    # Resolve the namespace path and check it stays within git root
-    namespace_path = (git_root / output_namespace).resolve()
+    # Reject escaping namespaces lexically before touching git at all, so
+    # bad input fails in microseconds instead of paying repo discovery.
+    namespace_raw = os.fspath(output_namespace)
+    if os.path.isabs(namespace_raw) or ".." in pathlib.PurePath(namespace_raw).parts:
+        msg = (
+            f"Invalid output_namespace: '{output_namespace}' would create "
+            "directories outside the git repository root. "
+            "Use relative paths without '..' to stay within the repository."
+        )
+        raise ValueError(msg)
 
-    # Security check: ensure the resolved path is inside the git repo
-    try:
-        namespace_path.relative_to(git_root)
-    except ValueError as e:
+    # Get the git repo root for validation
+    git_root_s = os.fspath(_cached_git_root())
+
+    # Normalize the namespace path once, lexically, as a string; the joined
+    # result is handed straight to normalize_directory_path so the whole call
+    # does a single normalization pass. abspath collapses ".." lexically, so
+    # the containment check below still rejects escapes.
+    namespace_s = os.path.abspath(os.path.join(git_root_s, namespace_raw))
+
+    # Defense in depth behind the lexical check above: ensure the normalized
+    # path is inside the git repo. commonpath is a pure string comparison —
+    # no exception in the happy path — and both arguments are absolute here.
+    if os.path.commonpath([namespace_s, git_root_s]) != git_root_s:
         msg = (
             f"Invalid output_namespace: '{output_namespace}' would create "
-            f"directories outside the git repository root ({git_root}). "
+            f"directories outside the git repository root ({git_root_s}). "
             "Use relative paths without '..' to stay within the repository."
         )
-        raise ValueError(msg) from e
+        raise ValueError(msg)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d/%H-%M-%S")
+    # f-string formatting skips strftime's format-string parse on every call.
+    from datetime import datetime
 
-    return normalize_directory_path(
-        namespace_path / timestamp / f"{get_commit_hash()}",
-        make_path=True,
+    now = datetime.now()
+    timestamp = (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}/{now.hour:02d}-{now.minute:02d}-"
+        f"{now.second:02d}"
     )
+
+    # The leaf is already absolute and is unique per second, so routing it
+    # through normalize_directory_path would only pollute that cache; create
+    # it directly.
+    leaf = os.path.join(namespace_s, timestamp, _cached_commit_hash())
+    os.makedirs(leaf, exist_ok=True)
+    return pathlib.Path(leaf)
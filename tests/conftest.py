@@ -2,98 +2,137 @@
 
 import pathlib
 import subprocess
+from collections.abc import Iterator
 
 import pytest
 
+from again_and_again.src import path_wizard
 
-@pytest.fixture
-def fake_git_repo(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
-    """
-    Create a temporary fake git repository for testing.
 
-    This fixture:
-    1. Creates a temporary directory with a .git folder
-    2. Initializes a real git repo with a commit
-    3. Monkeypatches git_wizard functions to use this temp repo
-    4. Returns the path to the fake repo
+def _clear_path_wizard_caches() -> None:
+    """Reset path_wizard's per-process git caches so monkeypatches apply."""
+    path_wizard._cached_git_root.cache_clear()
+    path_wizard._cached_commit_hash.cache_clear()
 
-    Args:
-        tmp_path: pytest's temporary directory fixture
-        monkeypatch: pytest's monkeypatch fixture
+
+@pytest.fixture(scope="session")
+def _fake_git_repo_dir(tmp_path_factory: pytest.TempPathFactory) -> tuple[pathlib.Path, str]:
+    """Create one real git repository for the whole test session.
+
+    The git subprocess work (init, config, commit) is the expensive part of
+    the old per-test fixture; the repository itself is read-only from the
+    tests' point of view, so building it once is safe.
 
     Returns:
-        Path to the fake git repository root
+        A tuple of (repository root path, HEAD commit hash).
     """
-    # Create a fake git repo directory
-    fake_repo = tmp_path / "fake_repo"
+    fake_repo = tmp_path_factory.mktemp("fake_git") / "fake_repo"
     fake_repo.mkdir()
 
-    # Initialize a real git repository (lightweight)
-    subprocess.run(["git", "init"], cwd=fake_repo, check=True, capture_output=True, text=True)
-
-    # Configure git user for commits
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=fake_repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=fake_repo,
-        check=True,
-        capture_output=True,
-    )
-
-    # Create a dummy file and make an initial commit
+    # Create a dummy file so there is something to commit
     dummy_file = fake_repo / "README.md"
     dummy_file.write_text("# Test Repository\n")
 
-    subprocess.run(["git", "add", "README.md"], cwd=fake_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=fake_repo,
-        check=True,
-        capture_output=True,
+    # One shell invocation instead of six git subprocesses: init, config,
+    # commit, and the rev-parse whose output becomes this function's hash.
+    script = (
+        "git init --quiet"
+        " && git config user.email test@example.com"
+        " && git config user.name 'Test User'"
+        " && git add README.md"
+        " && git commit --quiet -m 'Initial commit'"
+        " && git rev-parse HEAD"
     )
-
-    # Get the actual commit hash from this repo
     result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
+        ["bash", "-c", script],
         cwd=fake_repo,
         check=True,
         capture_output=True,
         text=True,
     )
-    commit_hash = result.stdout.strip()
+    return fake_repo, result.stdout.strip()
 
-    # Monkeypatch the git_wizard functions to use our fake repo
 
-    def mock_get_git_repo_root_path() -> pathlib.Path:
-        """Return the fake repo path."""
-        return fake_repo
+def _patch_git_functions(
+    monkeypatch: pytest.MonkeyPatch, fake_repo: pathlib.Path, commit_hash: str
+) -> None:
+    """Point every import location of the git functions at the fake repo.
 
-    def mock_get_commit_hash() -> str:
-        """Return the commit hash from the fake repo."""
-        return commit_hash
-
-    # Apply monkeypatches to all import locations
-    # 1. Patch the source modules
+    path_wizard resolves these lazily through the git_wizard module, so
+    patching the source module covers it too.
+    """
     monkeypatch.setattr(
         "again_and_again.src.git_wizard.get_git_repo_root_path",
-        mock_get_git_repo_root_path,
+        lambda: fake_repo,
     )
-    monkeypatch.setattr("again_and_again.src.git_wizard.get_commit_hash", mock_get_commit_hash)
+    monkeypatch.setattr("again_and_again.src.git_wizard.get_commit_hash", lambda: commit_hash)
+    monkeypatch.setattr("again_and_again.get_git_repo_root_path", lambda: fake_repo)
+    monkeypatch.setattr("again_and_again.get_commit_hash", lambda: commit_hash)
 
-    # 2. Patch the imports in path_wizard (it imports from git_wizard)
-    monkeypatch.setattr(
-        "again_and_again.src.path_wizard.get_git_repo_root_path",
-        mock_get_git_repo_root_path,
-    )
-    monkeypatch.setattr("again_and_again.src.path_wizard.get_commit_hash", mock_get_commit_hash)
 
-    # 3. Patch the main package exports (from __init__.py)
-    monkeypatch.setattr("again_and_again.get_git_repo_root_path", mock_get_git_repo_root_path)
-    monkeypatch.setattr("again_and_again.get_commit_hash", mock_get_commit_hash)
+@pytest.fixture(scope="module")
+def default_unique_path(_fake_git_repo_dir: tuple[pathlib.Path, str]) -> pathlib.Path:
+    """One create_unique_path_inside_of_a_git_repo() result shared per module.
+
+    Tests that only inspect the returned path can all read this single
+    invocation instead of redoing the git lookup and mkdirs each. The
+    function-scoped monkeypatch fixture cannot serve a module-scoped
+    fixture, so this patches through a MonkeyPatch context directly.
+    """
+    fake_repo, commit_hash = _fake_git_repo_dir
+    with pytest.MonkeyPatch.context() as mp:
+        _patch_git_functions(mp, fake_repo, commit_hash)
+        _clear_path_wizard_caches()
+        result = path_wizard.create_unique_path_inside_of_a_git_repo()
+        _clear_path_wizard_caches()
+    return result
+
+
+@pytest.fixture(scope="session")
+def commit_hash(_fake_git_repo_dir: tuple[pathlib.Path, str]) -> str:
+    """The fake repository's HEAD hash, computed once per session.
+
+    Tests asserting on hash content should use this instead of calling
+    get_commit_hash() themselves, so the lookup happens once per run.
+    """
+    return _fake_git_repo_dir[1]
+
+
+@pytest.fixture
+def fast_git(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin the commit hash to a constant for tests that ignore its value.
+
+    Stacks on top of fake_git_repo (list it after that fixture) so tests
+    exercising namespace handling skip the hash lookup entirely. Tests that
+    assert on hash content must not use this.
+    """
+    monkeypatch.setattr("again_and_again.src.git_wizard.get_commit_hash", lambda: "deadbeef")
+
+
+@pytest.fixture
+def fake_git_repo(
+    _fake_git_repo_dir: tuple[pathlib.Path, str], monkeypatch: pytest.MonkeyPatch
+) -> Iterator[pathlib.Path]:
+    """
+    Point the git_wizard functions at the session's fake git repository.
+
+    This fixture:
+    1. Monkeypatches git_wizard functions to use the shared session repo
+    2. Clears path_wizard's git caches so the patches take effect
+    3. Returns the path to the fake repo
+
+    Args:
+        _fake_git_repo_dir: the session-scoped repository fixture
+        monkeypatch: pytest's monkeypatch fixture
 
-    return fake_repo
+    Returns:
+        Path to the fake git repository root
+    """
+    fake_repo, commit_hash = _fake_git_repo_dir
+    _patch_git_functions(monkeypatch, fake_repo, commit_hash)
+
+    # Drop cached real-repo values so the patched functions are consulted,
+    # and clean up again so cached fake-repo values don't leak out.
+    _clear_path_wizard_caches()
+    yield fake_repo
+    _clear_path_wizard_caches()
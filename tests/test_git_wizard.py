@@ -6,7 +6,12 @@ from unittest.mock import patch
 
 import pytest
 
-from again_and_again import get_commit_hash, get_git_repo_root_path
+from again_and_again import (
+    get_commit_hash,
+    get_git_repo_root_path,
+    get_repo_root_and_commit_hash,
+)
+from again_and_again.src.git_wizard import PYGIT2_AVAILABLE, _read_head_direct
 
 
 class TestGetGitRepoRootPath:
@@ -24,11 +29,8 @@ class TestGetGitRepoRootPath:
 
     def test_raises_when_not_in_git_repo(self, tmp_path: pathlib.Path) -> None:
         """Should raise FileNotFoundError when not in a git repository."""
-        with (
-            patch("pathlib.Path.cwd", return_value=tmp_path),
-            pytest.raises(FileNotFoundError, match="Could not identify a git repository"),
-        ):
-            get_git_repo_root_path()
+        with pytest.raises(FileNotFoundError, match="Could not identify a git repository"):
+            get_git_repo_root_path(cwd=tmp_path)
 
 
 class TestGetCommitHash:
@@ -45,9 +47,19 @@ class TestGetCommitHash:
         assert len(result) == 40
         assert all(c in "0123456789abcdef" for c in result)
 
+    def test_coproc_matches_default_lookup(self) -> None:
+        """Should return the same hash through the coprocess path."""
+        assert get_commit_hash(use_coproc=True) == get_commit_hash()
+
     def test_raises_when_git_fails(self) -> None:
-        """Should raise RuntimeError when git command fails."""
+        """Should raise RuntimeError when not in a repo and git command fails."""
+        # Drop any hash memoized by earlier tests so the lookup actually runs.
+        get_commit_hash.cache_clear()
         with (
+            patch(
+                "again_and_again.src.git_wizard.get_git_repo_root_path",
+                side_effect=FileNotFoundError("no repo"),
+            ),
             patch(
                 "subprocess.check_output",
                 side_effect=subprocess.CalledProcessError(1, "git"),
@@ -55,3 +67,104 @@ class TestGetCommitHash:
             pytest.raises(RuntimeError, match="Not in a git repository"),
         ):
             get_commit_hash()
+
+
+class TestGetRepoRootAndCommitHash:
+    """Tests for get_repo_root_and_commit_hash function."""
+
+    def test_returns_root_and_hash(self) -> None:
+        """Should return the repo root as a Path and a 40-character hash."""
+        root, commit_hash = get_repo_root_and_commit_hash()
+        assert isinstance(root, pathlib.Path)
+        assert (root / ".git").exists()
+        assert len(commit_hash) == 40
+
+    def test_matches_individual_lookups(self) -> None:
+        """Should agree with get_git_repo_root_path and get_commit_hash."""
+        root, commit_hash = get_repo_root_and_commit_hash()
+        assert root == get_git_repo_root_path()
+        assert commit_hash == get_commit_hash()
+
+
+@pytest.mark.skipif(not PYGIT2_AVAILABLE, reason="pygit2 is not installed")
+class TestPygit2Backend:
+    """Tests exercising the libgit2-backed lookups when pygit2 is installed."""
+
+    def test_root_matches_git_rev_parse(self) -> None:
+        """Should agree with `git rev-parse --show-toplevel`."""
+        get_git_repo_root_path.cache_clear()
+        expected = subprocess.check_output(
+            ["git", "rev-parse", "--show-toplevel"], text=True
+        ).strip()
+        assert get_git_repo_root_path() == pathlib.Path(expected)
+
+    def test_hash_matches_subprocess_lookup(self) -> None:
+        """Should agree with the fast=False subprocess path."""
+        get_commit_hash.cache_clear()
+        assert get_commit_hash(fast=True) == get_commit_hash(fast=False)
+
+    def test_worktree_root_is_the_worktree_checkout(self, tmp_path: pathlib.Path) -> None:
+        """Should return the worktree checkout dir, not the main .git dir."""
+        main_repo = tmp_path / "main"
+        main_repo.mkdir()
+        script = (
+            "git init --quiet"
+            " && git config user.email test@example.com"
+            " && git config user.name 'Test User'"
+            " && git commit --quiet --allow-empty -m 'Initial commit'"
+            " && git worktree add --quiet ../wt"
+        )
+        subprocess.run(["bash", "-c", script], cwd=main_repo, check=True, capture_output=True)
+        get_git_repo_root_path.cache_clear()
+        worktree = (tmp_path / "wt").resolve()
+        assert get_git_repo_root_path(cwd=worktree).resolve() == worktree
+
+
+class TestReadHeadDirect:
+    """Tests for the _read_head_direct helper."""
+
+    _HASH = "a" * 40
+
+    def _make_git_dir(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        return git_dir
+
+    def test_symbolic_ref(self, tmp_path: pathlib.Path) -> None:
+        """Should follow a symbolic ref to the branch file."""
+        git_dir = self._make_git_dir(tmp_path)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "refs" / "heads" / "main").write_text(f"{self._HASH}\n")
+        assert _read_head_direct(git_dir) == self._HASH
+
+    def test_detached_head(self, tmp_path: pathlib.Path) -> None:
+        """Should return the hash stored directly in HEAD."""
+        git_dir = self._make_git_dir(tmp_path)
+        (git_dir / "HEAD").write_text(f"{self._HASH}\n")
+        assert _read_head_direct(git_dir) == self._HASH
+
+    def test_packed_refs(self, tmp_path: pathlib.Path) -> None:
+        """Should find the ref in packed-refs when no loose ref file exists."""
+        git_dir = self._make_git_dir(tmp_path)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text(
+            f"# pack-refs with: peeled fully-peeled sorted\n{self._HASH} refs/heads/main\n"
+        )
+        assert _read_head_direct(git_dir) == self._HASH
+
+    def test_worktree_pointer_file(self, tmp_path: pathlib.Path) -> None:
+        """Should follow a worktree .git pointer file to the real git dir."""
+        real_git_dir = tmp_path / "real" / ".git"
+        real_git_dir.mkdir(parents=True)
+        (real_git_dir / "HEAD").write_text(f"{self._HASH}\n")
+        pointer = tmp_path / "worktree" / ".git"
+        pointer.parent.mkdir()
+        pointer.write_text(f"gitdir: {real_git_dir}\n")
+        assert _read_head_direct(pointer) == self._HASH
+
+    def test_returns_none_for_unknown_layout(self, tmp_path: pathlib.Path) -> None:
+        """Should return None when the ref cannot be resolved from disk."""
+        git_dir = self._make_git_dir(tmp_path)
+        (git_dir / "HEAD").write_text("ref: refs/heads/missing\n")
+        assert _read_head_direct(git_dir) is None
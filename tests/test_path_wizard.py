@@ -1,6 +1,10 @@
 """Tests for path_wizard module."""
 
 import pathlib
+import re
+import shutil
+import stat
+from collections.abc import Callable
 
 import pytest
 
@@ -11,23 +15,33 @@ from again_and_again import (
     path_to_string,
 )
 
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TIME_PATTERN = re.compile(r"\d{2}-\d{2}-\d{2}")
 
-class TestNormalizeFilePath:
-    """Tests for normalize_file_path function."""
 
-    def test_returns_path_object(self, tmp_path: pathlib.Path) -> None:
-        """Should return a pathlib.Path object."""
-        result = normalize_file_path(tmp_path / "test.txt")
-        assert isinstance(result, pathlib.Path)
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """One scratch directory shared by the tests that never mutate it.
 
-    def test_accepts_string_path(self, tmp_path: pathlib.Path) -> None:
-        """Should accept a string path."""
-        result = normalize_file_path(str(tmp_path / "test.txt"))
-        assert isinstance(result, pathlib.Path)
+    Skips the per-test mkdir/rmtree that the function-scoped tmp_path
+    fixture would pay; tests that create or remove entries keep tmp_path.
+    numbered=False also skips mktemp's stat loop hunting for a free
+    suffix — the name is unique within this module's one use.
+    """
+    return tmp_path_factory.mktemp("pw_readonly", numbered=False)
+
+
+class TestNormalizeFilePath:
+    """Tests for normalize_file_path function."""
 
-    def test_accepts_path_object(self, tmp_path: pathlib.Path) -> None:
-        """Should accept a pathlib.Path object."""
-        result = normalize_file_path(tmp_path / "test.txt")
+    @pytest.mark.parametrize(
+        "convert", [lambda p: p, str, pathlib.Path], ids=["path", "str", "Path"]
+    )
+    def test_accepts_path_types(
+        self, shared_tmp: pathlib.Path, convert: Callable[[pathlib.Path], str | pathlib.Path]
+    ) -> None:
+        """Should accept str and pathlib.Path inputs and return a pathlib.Path."""
+        result = normalize_file_path(convert(shared_tmp / "test.txt"))
         assert isinstance(result, pathlib.Path)
 
     def test_creates_parent_directory_by_default(self, tmp_path: pathlib.Path) -> None:
@@ -36,6 +50,15 @@ class TestNormalizeFilePath:
         normalize_file_path(new_dir / "test.txt")
         assert new_dir.exists()
 
+    def test_recreates_parent_after_cache_clear(self, tmp_path: pathlib.Path) -> None:
+        """Should recreate a deleted parent directory once cache_clear is called."""
+        new_dir = tmp_path / "parent"
+        normalize_file_path(new_dir / "test.txt")
+        shutil.rmtree(new_dir)
+        normalize_file_path.cache_clear()
+        normalize_file_path(new_dir / "test.txt")
+        assert new_dir.is_dir()
+
     def test_does_not_create_parent_when_disabled(self, tmp_path: pathlib.Path) -> None:
         """Should not create parent directory when make_parent_path is False."""
         new_dir = tmp_path / "nonexistent"
@@ -47,9 +70,9 @@ class TestNormalizeFilePath:
         with pytest.raises(FileNotFoundError):
             normalize_file_path(tmp_path / "nonexistent.txt", path_should_exist=True)
 
-    def test_returns_resolved_path(self, tmp_path: pathlib.Path) -> None:
+    def test_returns_resolved_path(self, shared_tmp: pathlib.Path) -> None:
         """Should return an absolute resolved path."""
-        result = normalize_file_path(tmp_path / "test.txt")
+        result = normalize_file_path(shared_tmp / "test.txt")
         assert result.is_absolute()
 
     def test_raises_type_error_for_invalid_type(self) -> None:
@@ -70,8 +93,8 @@ class TestNormalizeDirectoryPath:
         """Should create the directory by default."""
         new_dir = tmp_path / "new_directory"
         normalize_directory_path(new_dir)
-        assert new_dir.exists()
-        assert new_dir.is_dir()
+        # One stat answers both "exists" and "is a directory"
+        assert stat.S_ISDIR(new_dir.stat().st_mode)
 
     def test_creates_nested_directories(self, tmp_path: pathlib.Path) -> None:
         """Should create nested directories."""
@@ -79,6 +102,22 @@ class TestNormalizeDirectoryPath:
         normalize_directory_path(new_dir)
         assert new_dir.exists()
 
+    def test_recreates_directory_after_cache_clear(self, tmp_path: pathlib.Path) -> None:
+        """Should recreate a deleted directory once cache_clear is called."""
+        new_dir = tmp_path / "recreated"
+        normalize_directory_path(new_dir)
+        shutil.rmtree(new_dir)
+        normalize_directory_path.cache_clear()
+        normalize_directory_path(new_dir)
+        assert new_dir.is_dir()
+
+    def test_raises_when_path_is_a_file(self, tmp_path: pathlib.Path) -> None:
+        """Should raise FileExistsError when the path exists as a regular file."""
+        file_path = tmp_path / "collision"
+        file_path.write_text("not a directory")
+        with pytest.raises(FileExistsError):
+            normalize_directory_path(file_path)
+
     def test_does_not_create_when_disabled(self, tmp_path: pathlib.Path) -> None:
         """Should not create directory when make_path is False."""
         new_dir = tmp_path / "nonexistent_dir"
@@ -94,9 +133,9 @@ class TestNormalizeDirectoryPath:
 class TestPathToString:
     """Tests for path_to_string function."""
 
-    def test_converts_path_to_string(self, tmp_path: pathlib.Path) -> None:
+    def test_converts_path_to_string(self, shared_tmp: pathlib.Path) -> None:
         """Should convert a Path object to a string."""
-        result = path_to_string(tmp_path)
+        result = path_to_string(shared_tmp)
         assert isinstance(result, str)
 
     def test_returns_string_as_is(self) -> None:
@@ -105,65 +144,59 @@ class TestPathToString:
         result = path_to_string(path_str)
         assert result == path_str
 
-    def test_resolves_path_when_converting(self, tmp_path: pathlib.Path) -> None:
+    def test_resolves_path_when_converting(self, shared_tmp: pathlib.Path) -> None:
         """Should resolve the path when converting to string."""
-        result = path_to_string(tmp_path)
+        result = path_to_string(shared_tmp)
         assert pathlib.Path(result).is_absolute()
 
 
 class TestCreateUniquePathInsideOfAGitRepo:
     """Tests for create_unique_path_inside_of_a_git_repo function."""
 
-    def test_returns_path_object(self, fake_git_repo: pathlib.Path) -> None:
+    def test_returns_path_object(self, default_unique_path: pathlib.Path) -> None:
         """Should return a pathlib.Path object."""
-        result = create_unique_path_inside_of_a_git_repo()
-        assert isinstance(result, pathlib.Path)
+        assert isinstance(default_unique_path, pathlib.Path)
 
-    def test_creates_directory(self, fake_git_repo: pathlib.Path) -> None:
+    def test_creates_directory(self, default_unique_path: pathlib.Path) -> None:
         """Should create the directory."""
-        result = create_unique_path_inside_of_a_git_repo()
-        assert result.exists()
-        assert result.is_dir()
+        assert stat.S_ISDIR(default_unique_path.stat().st_mode)
 
-    def test_uses_default_namespace(self, fake_git_repo: pathlib.Path) -> None:
+    def test_uses_default_namespace(self, default_unique_path: pathlib.Path) -> None:
         """Should use 'outputs' as default namespace."""
-        result = create_unique_path_inside_of_a_git_repo()
-        assert "outputs" in str(result)
+        assert "outputs" in str(default_unique_path)
 
-    def test_uses_custom_namespace(self, fake_git_repo: pathlib.Path) -> None:
+    def test_uses_custom_namespace(self, fake_git_repo: pathlib.Path, fast_git: None) -> None:
         """Should use custom namespace when provided."""
         result = create_unique_path_inside_of_a_git_repo(output_namespace="custom_outputs")
         assert "custom_outputs" in str(result)
 
-    def test_contains_commit_hash(self, fake_git_repo: pathlib.Path) -> None:
+    def test_contains_commit_hash(
+        self, default_unique_path: pathlib.Path, commit_hash: str
+    ) -> None:
         """Should contain the current commit hash in the path."""
-        from again_and_again import get_commit_hash
-
-        result = create_unique_path_inside_of_a_git_repo()
-        commit_hash = get_commit_hash()
-        assert commit_hash in str(result)
+        assert commit_hash in str(default_unique_path)
 
-    def test_contains_timestamp_format(self, fake_git_repo: pathlib.Path) -> None:
+    def test_contains_timestamp_format(self, default_unique_path: pathlib.Path) -> None:
         """Should contain a timestamp in YYYY-MM-DD/HH-MM-SS format."""
-        import re
-
-        result = create_unique_path_inside_of_a_git_repo()
+        path_str = str(default_unique_path)
         # Check for date pattern in path
-        assert re.search(r"\d{4}-\d{2}-\d{2}", str(result))
+        assert _DATE_PATTERN.search(path_str)
         # Check for time pattern in path
-        assert re.search(r"\d{2}-\d{2}-\d{2}", str(result))
-
-    def test_rejects_path_traversal_with_parent_dirs(self, fake_git_repo: pathlib.Path) -> None:
-        """Should reject output_namespace that tries to escape git repo with '..'."""
-        with pytest.raises(ValueError, match="outside the git repository root"):
-            create_unique_path_inside_of_a_git_repo(output_namespace="../../etc")
-
-    def test_rejects_absolute_paths(self, fake_git_repo: pathlib.Path) -> None:
-        """Should reject absolute paths as output_namespace."""
+        assert _TIME_PATTERN.search(path_str)
+
+    @pytest.mark.parametrize(
+        "escaping_namespace", ["../../etc", "/tmp/malicious"], ids=["traversal", "absolute"]
+    )
+    def test_rejects_paths_outside_repo(
+        self, fake_git_repo: pathlib.Path, escaping_namespace: str
+    ) -> None:
+        """Should reject output_namespace values that escape the git repo."""
         with pytest.raises(ValueError, match="outside the git repository root"):
-            create_unique_path_inside_of_a_git_repo(output_namespace="/tmp/malicious")
+            create_unique_path_inside_of_a_git_repo(output_namespace=escaping_namespace)
 
-    def test_allows_nested_relative_paths(self, fake_git_repo: pathlib.Path) -> None:
+    def test_allows_nested_relative_paths(
+        self, fake_git_repo: pathlib.Path, fast_git: None
+    ) -> None:
         """Should allow nested relative paths that stay within the repo."""
         result = create_unique_path_inside_of_a_git_repo(output_namespace="data/experiments")
         assert "data" in str(result)